@@ -1,9 +1,9 @@
 import pygame
 import time
-import numpy as np
 from utils.config import *
 from gui.retro_theme import RetroTheme
 from gui.pause_menu import PauseMenu
+from utils.helpers import render_text
 from logic.adaptive_logic import AdaptiveMazeGame
 
 class SinglePlayerGame:
@@ -23,6 +23,19 @@ class SinglePlayerGame:
         # Load theme
         self.theme = RetroTheme()
         
+        # Pre-render static stat labels; values are rendered on demand
+        self.stat_labels = [
+            self.theme.medium_font.render(label, True, NEON_GREEN)
+            for label in ("Level: ", "Time: ", "Moves: ", "Backtracks: ", "Difficulty: ")
+        ]
+        
+        # Row offset and label width of each stat, measured once
+        self.stats_layout = [
+            (label, i * 30, label.get_width())
+            for i, label in enumerate(self.stat_labels)
+        ]
+        self.stats_height = (len(self.stat_labels) - 1) * 30 + self.stat_labels[0].get_height()
+        
         # Create adaptive maze game
         self.game = AdaptiveMazeGame(player_id)
         
@@ -30,7 +43,7 @@ class SinglePlayerGame:
         self.load_new_level()
         
         # Create pause menu
-        self.pause_menu = PauseMenu(self.screen, self.resume_game, self.return_to_main_menu)
+        self.pause_menu = PauseMenu.get(self.screen, self.resume_game, self.return_to_main_menu, self.theme)
     
     def load_new_level(self):
         """Generate new level with player tracking."""
@@ -44,7 +57,8 @@ class SinglePlayerGame:
         self.maze_height, self.maze_width = self.maze.shape
         
         # Player starts at entry point (value 2 in maze)
-        self.player_pos = np.argwhere(self.maze == 2)[0].astype(float)
+        row, col = self.game.start_pos
+        self.player_pos = (int(row), int(col))
         
         # Calculate pixel dimensions
         self.maze_pixel_width = self.maze_width * TILE_SIZE
@@ -54,12 +68,43 @@ class SinglePlayerGame:
         self.panel_width = min(800, self.maze_pixel_width)
         self.panel_height = min(800, self.maze_pixel_height)
         
+        # Pre-render the static maze once per level
+        self.static_maze = self._render_static_maze()
+        
         # Path tracking for backtracking detection
-        self.path = [tuple(self.player_pos.astype(int))]
+        self.path = [self.player_pos]
+        self.path_set = set(self.path)
+        
+        # Persistent game panel, composed whenever the maze view changes
+        self.game_panel = pygame.Surface((self.panel_width, self.panel_height)).convert()
+        self.maze_dirty = True
+        
+        # Push the whole screen to the display on the next frame
+        self.full_update = True
         
         # Timer 
         self.start_time = time.time()
     
+    def _render_static_maze(self):
+        """Render all maze tiles onto a single surface for the current level."""
+        static_maze = pygame.Surface((self.maze_pixel_width, self.maze_pixel_height)).convert()
+        static_maze.fill(BLACK)
+        
+        tiles = {
+            1: self.theme.wall_tile,   # Wall
+            0: self.theme.path_tile,   # Path
+            2: self.theme.start_tile,  # Start
+            3: self.theme.goal_tile    # Goal
+        }
+        
+        for row in range(self.maze_height):
+            for col in range(self.maze_width):
+                tile = tiles.get(self.maze[row, col])
+                if tile is not None:
+                    static_maze.blit(tile, (col * TILE_SIZE, row * TILE_SIZE))
+        
+        return static_maze
+    
     def calculate_camera(self):
         """Calculate camera position to follow player."""
         # Center camera on player
@@ -74,77 +119,82 @@ class SinglePlayerGame:
                 max(0, min(cam_y, max_cam_y)))
     
     def draw_game(self):
-        """Draw the game screen."""
+        """Draw the game screen.
+        
+        Returns the list of screen rects to push to the display.
+        """
+        dirty_rects = []
+        
         # Fill background
         self.screen.fill(BLACK)
         
-        # Calculate camera position
-        cam_x, cam_y = self.calculate_camera()
-        
         # Calculate panel position (center it on screen)
         panel_x = (self.width - self.panel_width) // 2
         panel_y = (self.height - self.panel_height) // 2
+        border = pygame.Rect(panel_x-2, panel_y-2, self.panel_width+4, self.panel_height+4)
         
-        # Create game panel
-        game_panel = pygame.Surface((self.panel_width, self.panel_height))
-        game_panel.fill(BLACK)
-        
-        # Draw maze tiles on panel
-        for row in range(self.maze_height):
-            for col in range(self.maze_width):
-                # Calculate tile position within panel
-                x = col * TILE_SIZE - cam_x
-                y = row * TILE_SIZE - cam_y
-                
-                # Skip tiles outside the panel
-                if (x + TILE_SIZE <= 0 or x >= self.panel_width or
-                    y + TILE_SIZE <= 0 or y >= self.panel_height):
-                    continue
-                
-                # Draw appropriate tile
-                if self.maze[row, col] == 1:  # Wall
-                    game_panel.blit(self.theme.wall_tile, (x, y))
-                elif self.maze[row, col] == 0:  # Path
-                    game_panel.blit(self.theme.path_tile, (x, y))
-                elif self.maze[row, col] == 2:  # Start
-                    game_panel.blit(self.theme.start_tile, (x, y))
-                elif self.maze[row, col] == 3:  # Goal
-                    game_panel.blit(self.theme.goal_tile, (x, y))
-        
-        # Draw player
-        player_x = self.player_pos[1] * TILE_SIZE - cam_x
-        player_y = self.player_pos[0] * TILE_SIZE - cam_y
-        game_panel.blit(self.theme.player_sprite, (player_x, player_y))
+        # Recompose the game panel only after the player moved or the level changed
+        if self.maze_dirty:
+            # Calculate camera position
+            cam_x, cam_y = self.calculate_camera()
+            
+            # Clear game panel
+            game_panel = self.game_panel
+            game_panel.fill(BLACK)
+            
+            # Draw the visible part of the pre-rendered maze
+            game_panel.blit(self.static_maze, (0, 0),
+                            area=pygame.Rect(cam_x, cam_y, self.panel_width, self.panel_height))
+            
+            # Draw player
+            player_x = self.player_pos[1] * TILE_SIZE - cam_x
+            player_y = self.player_pos[0] * TILE_SIZE - cam_y
+            game_panel.blit(self.theme.player_sprite, (player_x, player_y))
+            
+            self.maze_dirty = False
+            dirty_rects.append(border)
         
         # Blit panel to screen
-        self.screen.blit(game_panel, (panel_x, panel_y))
+        self.screen.blit(self.game_panel, (panel_x, panel_y))
         
         # Draw game panel border
-        pygame.draw.rect(self.screen, NEON_BLUE, 
-                       (panel_x-2, panel_y-2, self.panel_width+4, self.panel_height+4), 
-                       2)
+        pygame.draw.rect(self.screen, NEON_BLUE, border, 2)
         
         # Draw stats
-        self.draw_stats(panel_x + self.panel_width + 20, panel_y)
+        stats_x = panel_x + self.panel_width + 20
+        self.draw_stats(stats_x, panel_y)
+        
+        # Stat values change width, so refresh the whole stats column
+        dirty_rects.append(pygame.Rect(stats_x, panel_y, self.width - stats_x, self.stats_height))
+        
+        if self.full_update:
+            self.full_update = False
+            return [self.screen.get_rect()]
+        return dirty_rects
     
     def draw_stats(self, x, y):
         """Draw game statistics."""
-        stats = [
-            f"Level: {self.game.current_level}",
-            f"Time: {time.time() - self.start_time:.1f}s",
-            f"Moves: {self.player_tracker.total_moves}",
-            f"Backtracks: {self.player_tracker.backtracks}",
-            f"Difficulty: {self.game.difficulty}"
+        values = [
+            f"{self.game.current_level}",
+            f"{time.time() - self.start_time:.1f}s",
+            f"{self.player_tracker.total_moves}",
+            f"{self.player_tracker.backtracks}",
+            f"{self.game.difficulty}"
         ]
         
-        for i, stat in enumerate(stats):
-            text = self.theme.medium_font.render(stat, True, NEON_GREEN)
-            self.screen.blit(text, (x, y + i * 30))
+        # Blit every label and value in one batch
+        blit_sequence = []
+        for (label, row_y, label_width), value in zip(self.stats_layout, values):
+            value_surface = render_text(value, self.theme.medium_font, NEON_GREEN)
+            blit_sequence.append((label, (x, y + row_y)))
+            blit_sequence.append((value_surface, (x + label_width, y + row_y)))
+        
+        self.screen.blits(blit_sequence, doreturn=False)
     
     def move_player(self, dx, dy):
         """Move player with collision detection."""
-        new_pos = self.player_pos + [dy, dx]
-        new_row, new_col = new_pos.astype(int)
+        new_row = self.player_pos[0] + dy
+        new_col = self.player_pos[1] + dx
         
         # Check if move is valid (within bounds and not a wall)
         if (0 <= new_row < self.maze_height and 
@@ -153,12 +203,14 @@ class SinglePlayerGame:
             
             # Check for backtracking
             current = (new_row, new_col)
-            if current in self.path[:-1]:
+            if current in self.path_set:
                 self.player_tracker.backtracks += 1
             
             # Update position
-            self.player_pos = new_pos
+            self.player_pos = current
             self.path.append(current)
+            self.path_set.add(current)
+            self.maze_dirty = True
             self.player_tracker.total_moves += 1
             
             # Check if reached goal
@@ -193,10 +245,12 @@ class SinglePlayerGame:
     def toggle_pause(self):
         """Toggle the pause state of the game."""
         self.paused = not self.paused
+        self.full_update = True
     
     def resume_game(self):
         """Resume the game from pause."""
         self.paused = False
+        self.full_update = True
     
     def return_to_main_menu(self):
         """Return to main menu."""
@@ -206,11 +260,14 @@ class SinglePlayerGame:
         """Main game loop."""
         while self.running:
             if self.paused:
-                self.pause_menu.draw()
+                dirty_rects = self.pause_menu.draw()
                 self.pause_menu.handle_events()
             else:
                 self.handle_events()
-                self.draw_game()
+                dirty_rects = self.draw_game()
                 
-            pygame.display.flip()
-            self.clock.tick(FPS)
\ No newline at end of file
+            pygame.display.update(dirty_rects)
+            self.clock.tick(FPS)
+        
+        # The pause menu is shared; don't let it keep this game alive
+        self.pause_menu.release()
\ No newline at end of file
@@ -1,9 +1,8 @@
 import pygame
 import sys
 from utils.config import *
-from utils.helpers import create_neon_button, center_rect
+from utils.helpers import create_neon_button
 from gui.retro_theme import RetroTheme
-from logic.singleplayer import PlayerTracker
 from logic.player_vs_bot import PlayerVsBotGame
 
 class MainMenu:
@@ -24,6 +23,21 @@ class MainMenu:
         # Create buttons
         self.create_buttons()
         
+        # The menu is static, so it is only redrawn when something changes
+        self.needs_redraw = True
+        
+        # Button surfaces built so far, keyed by (button text, hover state)
+        self.button_surfaces = {}
+        
+        # Background pattern tiled across the screen
+        self.background = self.theme.get_background(self.width, self.height)
+        
+        # Title and subtitle never change, so render their glow and center them once
+        self.title_text = self.theme.get_glowing_text("RETRO MAZE", 72, NEON_CYAN)
+        self.subtitle_text = self.theme.get_glowing_text("A FUTURISTIC ADVENTURE", 32, NEON_PINK)
+        self.title_pos = ((self.width - self.title_text.get_width()) // 2, 100)
+        self.subtitle_pos = ((self.width - self.subtitle_text.get_width()) // 2, 180)
+        
     def create_buttons(self):
         """Create menu buttons."""
         button_width = 300
@@ -67,54 +81,49 @@ class MainMenu:
     
     def draw(self):
         """Draw the main menu."""
-        # Fill screen with black
-        self.screen.fill(BLACK)
+        # Draw pre-tiled background pattern; it covers the whole screen
+        self.screen.blit(self.background, (0, 0))
         
-        # Tile background pattern
-        for x in range(0, self.width, 800):
-            for y in range(0, self.height, 800):
-                self.screen.blit(self.theme.background, (x, y))
+        # Draw title and subtitle
+        self.screen.blit(self.title_text, self.title_pos)
+        self.screen.blit(self.subtitle_text, self.subtitle_pos)
         
-        # Draw title
-        title_text = self.theme.get_glowing_text("RETRO MAZE", 72, NEON_CYAN)
-        subtitle_text = self.theme.get_glowing_text("A FUTURISTIC ADVENTURE", 32, NEON_PINK)
+        # Draw buttons, reading the mouse position once for all of them
+        mouse_pos = pygame.mouse.get_pos()
+        for button in self.buttons:
+            hover = button['rect'].collidepoint(mouse_pos)
+            self.screen.blit(self.get_button_surface(button, hover), button['rect'])
+    
+    def get_button_surface(self, button, hover):
+        """Return the glowing surface for a button, building it on first use."""
+        key = (button['text'], hover)
+        button_surf = self.button_surfaces.get(key)
+        if button_surf is not None:
+            return button_surf
         
-        # Center and draw title
-        title_x = (self.width - title_text.get_width()) // 2
-        self.screen.blit(title_text, (title_x, 100))
+        # Different colors based on hover state
+        if hover:
+            text_color = NEON_YELLOW
+            glow_color = NEON_YELLOW
+            bg_color = (40, 40, 50)
+        else:
+            text_color = NEON_GREEN
+            glow_color = NEON_GREEN
+            bg_color = (20, 20, 30)
         
-        # Center and draw subtitle
-        subtitle_x = (self.width - subtitle_text.get_width()) // 2
-        self.screen.blit(subtitle_text, (subtitle_x, 180))
+        # Create button surface
+        button_surf = create_neon_button(
+            button['text'], 
+            self.theme.large_font, 
+            button['rect'].width, 
+            button['rect'].height,
+            text_color, 
+            glow_color,
+            bg_color
+        )
         
-        # Draw buttons
-        for button in self.buttons:
-            # Create button surface with glow
-            hover = button['rect'].collidepoint(pygame.mouse.get_pos())
-            
-            # Different colors based on hover state
-            if hover:
-                text_color = NEON_YELLOW
-                glow_color = NEON_YELLOW
-                bg_color = (40, 40, 50)
-            else:
-                text_color = NEON_GREEN
-                glow_color = NEON_GREEN
-                bg_color = (20, 20, 30)
-            
-            # Create button surface
-            button_surf = create_neon_button(
-                button['text'], 
-                self.theme.large_font, 
-                button['rect'].width, 
-                button['rect'].height,
-                text_color, 
-                glow_color,
-                bg_color
-            )
-            
-            # Draw button
-            self.screen.blit(button_surf, button['rect'])
+        self.button_surfaces[key] = button_surf
+        return button_surf
     
     def handle_events(self):
         """Handle user input events."""
@@ -124,12 +133,24 @@ class MainMenu:
             elif event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.quit_game()
+            elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self.needs_redraw = True
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
                     # Check button clicks
                     for button in self.buttons:
                         if button['rect'].collidepoint(event.pos):
                             button['action']()
+                            # A game mode drew over the menu
+                            self.needs_redraw = True
+    
+    def hovered_button(self):
+        """Return the index of the button under the mouse, or None."""
+        mouse_pos = pygame.mouse.get_pos()
+        for index, button in enumerate(self.buttons):
+            if button['rect'].collidepoint(mouse_pos):
+                return index
+        return None
     
     def start_single_player(self):
         """Launch the single player game mode."""
@@ -150,8 +171,16 @@ class MainMenu:
     
     def run(self):
         """Main menu loop."""
+        last_hover = None
         while self.running:
             self.handle_events()
-            self.draw()
-            pygame.display.flip()
+            
+            # Redraw only when the hovered button changes or the screen was overdrawn
+            hover = self.hovered_button()
+            if self.needs_redraw or hover != last_hover:
+                self.draw()
+                pygame.display.flip()
+                last_hover = hover
+                self.needs_redraw = False
+            
             self.clock.tick(FPS)
\ No newline at end of file
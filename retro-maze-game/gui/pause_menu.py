@@ -7,18 +7,54 @@ from gui.retro_theme import RetroTheme
 class PauseMenu:
     """Pause menu screen."""
     
-    def __init__(self, screen, resume_callback, quit_callback):
-        """Initialize the pause menu."""
+    # Menu shared by every game, handed out by get()
+    _instance = None
+    
+    def __init__(self, screen, resume_callback, quit_callback, theme=None):
+        """Initialize the pause menu, sharing the caller's theme when given."""
         self.screen = screen
         self.resume_callback = resume_callback
         self.quit_callback = quit_callback
         self.width, self.height = screen.get_size()
         
         # Load theme
-        self.theme = RetroTheme()
+        self.theme = theme if theme is not None else RetroTheme()
         
         # Create buttons
         self.create_buttons()
+        
+        # The overlay and title look the same every frame, so build them once
+        self.overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 200))  # Semi-transparent black
+        if pygame.display.get_surface() is not None:
+            self.overlay = self.overlay.convert_alpha()
+        self.paused_text = self.theme.get_glowing_text("PAUSED", 64, NEON_PURPLE)
+        self.paused_pos = ((self.width - self.paused_text.get_width()) // 2, 150)
+    
+    @classmethod
+    def get(cls, screen, resume_callback, quit_callback, theme=None):
+        """Return the shared pause menu, rebound to the given screen and callbacks.
+        
+        A new menu is only built the first time or when the screen size changes.
+        """
+        menu = cls._instance
+        if menu is None or screen.get_size() != (menu.width, menu.height):
+            menu = cls._instance = cls(screen, resume_callback, quit_callback, theme)
+            return menu
+        
+        menu.screen = screen
+        menu.resume_callback = resume_callback
+        menu.quit_callback = quit_callback
+        menu.resume_btn['action'] = resume_callback
+        menu.quit_btn['action'] = quit_callback
+        return menu
+    
+    def release(self):
+        """Drop the game callbacks so the shared menu does not keep a finished game alive."""
+        self.resume_callback = None
+        self.quit_callback = None
+        self.resume_btn['action'] = None
+        self.quit_btn['action'] = None
     
     def create_buttons(self):
         """Create menu buttons."""
@@ -50,47 +86,52 @@ class PauseMenu:
         }
         
         self.buttons = [self.resume_btn, self.quit_btn]
+        
+        # Each button only ever shows two looks, so bake both up front
+        for button in self.buttons:
+            button['surf_normal'] = self._create_button_surface(button, False)
+            button['surf_hover'] = self._create_button_surface(button, True)
     
-    def draw(self):
-        """Draw the pause menu overlay."""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))  # Semi-transparent black
-        self.screen.blit(overlay, (0, 0))
+    def _create_button_surface(self, button, hover):
+        """Render a button in its normal or hover colors."""
+        # Different colors based on hover state
+        if hover:
+            text_color = NEON_YELLOW
+            glow_color = NEON_YELLOW
+            bg_color = (40, 40, 50)
+        else:
+            text_color = NEON_GREEN
+            glow_color = NEON_GREEN
+            bg_color = (20, 20, 30)
         
-        # Draw paused text
-        paused_text = self.theme.get_glowing_text("PAUSED", 64, NEON_PURPLE)
-        text_x = (self.width - paused_text.get_width()) // 2
-        self.screen.blit(paused_text, (text_x, 150))
+        return create_neon_button(
+            button['text'],
+            self.theme.medium_font,
+            button['rect'].width,
+            button['rect'].height,
+            text_color,
+            glow_color,
+            bg_color
+        )
+    
+    def draw(self):
+        """Draw the pause menu overlay and return the updated screen rects."""
+        # Darken the screen with the cached overlay, then draw paused text
+        blit_sequence = [(self.overlay, (0, 0)), (self.paused_text, self.paused_pos)]
         
-        # Draw buttons
+        # Add buttons, reading the mouse position once for all of them
+        mouse_pos = pygame.mouse.get_pos()
         for button in self.buttons:
             # Check for hover state
-            hover = button['rect'].collidepoint(pygame.mouse.get_pos())
-            
-            # Different colors based on hover state
-            if hover:
-                text_color = NEON_YELLOW
-                glow_color = NEON_YELLOW
-                bg_color = (40, 40, 50)
-            else:
-                text_color = NEON_GREEN
-                glow_color = NEON_GREEN
-                bg_color = (20, 20, 30)
-            
-            # Create button surface
-            button_surf = create_neon_button(
-                button['text'],
-                self.theme.medium_font,
-                button['rect'].width,
-                button['rect'].height,
-                text_color,
-                glow_color,
-                bg_color
-            )
-            
-            # Draw button
-            self.screen.blit(button_surf, button['rect'])
+            hover = button['rect'].collidepoint(mouse_pos)
+            button_surf = button['surf_hover'] if hover else button['surf_normal']
+            blit_sequence.append((button_surf, button['rect']))
+        
+        # Blit everything in one batch, back to front
+        self.screen.blits(blit_sequence, doreturn=False)
+        
+        # The overlay darkens the whole screen
+        return [self.screen.get_rect()]
     
     def handle_events(self):
         """Handle pause menu input events."""
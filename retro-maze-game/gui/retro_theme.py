@@ -1,73 +1,164 @@
 import pygame
 import os
+import numpy as np
+from collections import OrderedDict
+from functools import cached_property, lru_cache
 from utils.config import *
 from utils.helpers import load_font, create_glowing_text
 
+# Generated theme surfaces shared by every RetroTheme, keyed by name
+_SURFACE_CACHE = {}
+
+# Recently rendered glowing text, keyed by (text, size, color, glow color)
+_GLOW_TEXT_CACHE = OrderedDict()
+_GLOW_TEXT_CACHE_SIZE = 256
+
+@lru_cache(maxsize=None)
+def _glow_disc_mask():
+    """Boolean [x, y] mask of the glow disc behind the start and goal tiles."""
+    # Rasterize the circle once; every tile reuses the mask
+    disc = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+    pygame.draw.circle(disc, WHITE, (TILE_SIZE//2, TILE_SIZE//2), TILE_SIZE//2)
+    return pygame.surfarray.array_alpha(disc) > 0
+
+@lru_cache(maxsize=None)
+def _theme_font_paths():
+    """Return the (title, text) font paths from FONT_DIR, listing it only once."""
+    # Try to load custom fonts from assets folder
+    try:
+        # Look for .ttf files in the fonts directory
+        font_files = [f for f in os.listdir(FONT_DIR) if f.endswith('.ttf')]
+    except (FileNotFoundError, OSError):
+        # Fallback to system fonts if directory doesn't exist
+        return None, None
+    
+    if not font_files:
+        # Fallback to system fonts
+        return None, None
+    
+    title_font_path = os.path.join(FONT_DIR, font_files[0])
+    text_font_path = os.path.join(FONT_DIR, font_files[-1] if len(font_files) > 1 else font_files[0])
+    return title_font_path, text_font_path
+
+@lru_cache(maxsize=64)
+def _load_theme_font(font_path, size):
+    """Create a font object from the given path and size."""
+    if font_path and os.path.exists(font_path):
+        try:
+            return pygame.font.Font(font_path, size)
+        except pygame.error:
+            pass
+    
+    # Fallback options
+    try:
+        return pygame.font.SysFont("Arial", size)
+    except:
+        return pygame.font.Font(None, size)
+
 class RetroTheme:
     """Defines the retro-futuristic visual style for the game."""
     
     def __init__(self):
         """Initialize the retro theme with fonts and visual elements."""
-        pygame.init()
+        # Only fonts are needed here; re-running pygame.init() for every theme
+        # would touch every subsystem (audio included) again
+        if not pygame.font.get_init():
+            pygame.font.init()
+            # Fonts and text made before the font module was shut down are stale
+            _load_theme_font.cache_clear()
+            _GLOW_TEXT_CACHE.clear()
+        
+        # Screen-sized background, built on first request
+        self.screen_background = None
         
         # Initialize fonts
         self.init_fonts()
         
-        # Load or create visual elements
-        self.init_visual_elements()
+        # Fonts and visual elements below are created on first access, so a
+        # screen only pays for the ones it draws
     
     def init_fonts(self):
-        """Load custom fonts or fall back to system fonts."""
-        # Try to load custom fonts from assets folder
-        try:
-            # Look for .ttf files in the fonts directory
-            font_files = [f for f in os.listdir(FONT_DIR) if f.endswith('.ttf')]
-            
-            if font_files:
-                self.title_font_path = os.path.join(FONT_DIR, font_files[0])
-                self.text_font_path = os.path.join(FONT_DIR, font_files[-1] if len(font_files) > 1 else font_files[0])
-            else:
-                # Fallback to system fonts
-                self.title_font_path = None
-                self.text_font_path = None
-        except (FileNotFoundError, OSError):
-            # Fallback to system fonts if directory doesn't exist
-            self.title_font_path = None
-            self.text_font_path = None
-        
-        # Create font objects in various sizes
-        self.title_font = self._create_font(self.title_font_path, 64)
-        self.subtitle_font = self._create_font(self.title_font_path, 48)
-        self.large_font = self._create_font(self.text_font_path, 36)
-        self.medium_font = self._create_font(self.text_font_path, 28)
-        self.small_font = self._create_font(self.text_font_path, 18)
+        """Find custom fonts or fall back to system fonts."""
+        # Custom fonts from the assets folder; the folder is only listed once
+        self.title_font_path, self.text_font_path = _theme_font_paths()
+    
+    # Font objects in various sizes
+    @cached_property
+    def title_font(self):
+        return self._create_font(self.title_font_path, 64)
+    
+    @cached_property
+    def subtitle_font(self):
+        return self._create_font(self.title_font_path, 48)
+    
+    @cached_property
+    def large_font(self):
+        return self._create_font(self.text_font_path, 36)
+    
+    @cached_property
+    def medium_font(self):
+        return self._create_font(self.text_font_path, 28)
+    
+    @cached_property
+    def small_font(self):
+        return self._create_font(self.text_font_path, 18)
     
     def _create_font(self, font_path, size):
-        """Create a font object from the given path and size."""
-        if font_path and os.path.exists(font_path):
+        """Create a font object from the given path and size, shared across themes."""
+        return _load_theme_font(font_path, size)
+    
+    # Grid pattern background
+    @cached_property
+    def background(self):
+        return self._shared_surface(
+            "background", lambda: self._create_grid_background(32, DARK_GRAY, BLACK), alpha=False)
+    
+    # Tile surfaces
+    @cached_property
+    def wall_tile(self):
+        return self._shared_surface("wall_tile", self._create_wall_tile, alpha=False)
+    
+    @cached_property
+    def path_tile(self):
+        return self._shared_surface("path_tile", self._create_path_tile, alpha=False)
+    
+    @cached_property
+    def start_tile(self):
+        return self._shared_surface("start_tile", self._create_start_tile, alpha=False)
+    
+    @cached_property
+    def goal_tile(self):
+        return self._shared_surface("goal_tile", self._create_goal_tile, alpha=False)
+    
+    @cached_property
+    def player_sprite(self):
+        return self._shared_surface("player_sprite", self._create_player_sprite, alpha=True)
+    
+    @cached_property
+    def bot_sprite(self):
+        return self._shared_surface("bot_sprite", self._create_bot_sprite, alpha=True)
+    
+    def _shared_surface(self, name, create, alpha):
+        """Return a theme surface, building it only if no earlier theme has.
+        
+        alpha picks the display conversion: per-pixel alpha (True) or opaque (False).
+        """
+        surface = _SURFACE_CACHE.get(name)
+        if surface is not None:
+            return surface
+        
+        surface = create()
+        
+        # Match the display pixel format so blits skip per-pixel conversion.
+        # Surfaces built before a display exists are not cached, so they get
+        # converted once one does.
+        if pygame.display.get_surface() is not None:
             try:
-                return pygame.font.Font(font_path, size)
+                surface = surface.convert_alpha() if alpha else surface.convert()
             except pygame.error:
-                pass
-        
-        # Fallback options
-        try:
-            return pygame.font.SysFont("Arial", size)
-        except:
-            return pygame.font.Font(None, size)
-    
-    def init_visual_elements(self):
-        """Initialize visual elements like backgrounds, tiles, etc."""
-        # Create a grid pattern background
-        self.background = self._create_grid_background(32, DARK_GRAY, BLACK)
-        
-        # Create tile surfaces
-        self.wall_tile = self._create_wall_tile()
-        self.path_tile = self._create_path_tile()
-        self.start_tile = self._create_start_tile()
-        self.goal_tile = self._create_goal_tile()
-        self.player_sprite = self._create_player_sprite()
-        self.bot_sprite = self._create_bot_sprite()
+                return surface
+            _SURFACE_CACHE[name] = surface
+        return surface
     
     def _create_grid_background(self, grid_size, line_color, bg_color):
         """Create a grid pattern background."""
@@ -75,13 +166,36 @@ class RetroTheme:
         bg = pygame.Surface((800, 800))
         bg.fill(bg_color)
         
-        # Draw vertical and horizontal grid lines
-        for i in range(0, 800, grid_size):
-            pygame.draw.line(bg, line_color, (i, 0), (i, 800), 1)
-            pygame.draw.line(bg, line_color, (0, i), (800, i), 1)
+        # Draw vertical and horizontal grid lines as two strided stores into the
+        # pixel array (indexed [x, y]); releasing the view unlocks the surface
+        pixels = pygame.surfarray.pixels3d(bg)
+        pixels[::grid_size, :] = line_color
+        pixels[:, ::grid_size] = line_color
+        del pixels
         
         return bg
     
+    def get_background(self, width, height):
+        """Return the grid background tiled over a width x height surface."""
+        background = self.screen_background
+        if background is not None and background.get_size() == (width, height):
+            return background
+        
+        background = pygame.Surface((width, height))
+        background.fill(BLACK)
+        tile_width, tile_height = self.background.get_size()
+        background.blits(
+            [(self.background, (x, y))
+             for x in range(0, width, tile_width)
+             for y in range(0, height, tile_height)],
+            doreturn=False
+        )
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        
+        self.screen_background = background
+        return background
+    
     def _create_wall_tile(self):
         """Create a neon wall tile."""
         tile = pygame.Surface((TILE_SIZE, TILE_SIZE))
@@ -119,9 +233,7 @@ class RetroTheme:
         tile.blit(text, (x, y))
         
         # Add glow effect
-        glow = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (*START_COLOR, 100), (TILE_SIZE//2, TILE_SIZE//2), TILE_SIZE//2)
-        tile.blit(glow, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+        self._add_glow_disc(tile, START_COLOR)
         
         return tile
     
@@ -137,12 +249,17 @@ class RetroTheme:
         tile.blit(text, (x, y))
         
         # Add glow effect
-        glow = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (*GOAL_COLOR, 100), (TILE_SIZE//2, TILE_SIZE//2), TILE_SIZE//2)
-        tile.blit(glow, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+        self._add_glow_disc(tile, GOAL_COLOR)
         
         return tile
     
+    def _add_glow_disc(self, tile, color):
+        """Additively blend color into the tile inside the glow disc, saturating at 255."""
+        mask = _glow_disc_mask()
+        pixels = pygame.surfarray.pixels3d(tile)
+        pixels[mask] = np.minimum(pixels[mask] + np.array(color, dtype=np.uint16), 255)
+        del pixels
+    
     def _create_player_sprite(self):
         """Create player sprite."""
         sprite = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
@@ -185,6 +302,12 @@ class RetroTheme:
         if glow_color is None:
             glow_color = color
         
+        key = (text, size, color, glow_color)
+        text_surface = _GLOW_TEXT_CACHE.get(key)
+        if text_surface is not None:
+            _GLOW_TEXT_CACHE.move_to_end(key)
+            return text_surface
+        
         # Choose appropriate font based on size
         if size >= 48:
             font = self.title_font
@@ -200,4 +323,8 @@ class RetroTheme:
         # Create text with glow
         text_surface = create_glowing_text(text, font, color, glow_color)
         
+        # Keep the most recent renders; evict the oldest
+        _GLOW_TEXT_CACHE[key] = text_surface
+        if len(_GLOW_TEXT_CACHE) > _GLOW_TEXT_CACHE_SIZE:
+            _GLOW_TEXT_CACHE.popitem(last=False)
         return text_surface
\ No newline at end of file
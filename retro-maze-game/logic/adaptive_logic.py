@@ -2,6 +2,7 @@ from logic.maze_logic import MazeGenerator
 from logic.singleplayer import PlayerTracker
 import json
 import random
+import numpy as np
 
 class AdaptiveMazeGame:
     def __init__(self, player_id):
@@ -9,7 +10,12 @@ class AdaptiveMazeGame:
         self.current_level = 1
         self.player_skill = "beginner"
         self.performance_history = []
+        self.prev_size = 0
         self.maze_params = self._get_maze_parameters("beginner")
+        
+        # Entry and exit cells of the current maze, recorded when it is generated
+        self.start_pos = None
+        self.goal_pos = None
     
     def _get_maze_parameters(self, skill_level):
         """Dynamically adjust maze parameters based on skill and level, with a max size of 31x31."""
@@ -33,7 +39,6 @@ class AdaptiveMazeGame:
         new_size = min(new_size, 31)
         
         # Track size changes
-        self.prev_size = getattr(self, 'prev_size', 0)
         self.maze_shape_changed = (new_size != self.prev_size)
         self.prev_size = new_size
         
@@ -60,41 +65,37 @@ class AdaptiveMazeGame:
         # Set entry point at the center
         center_x, center_y = self.maze_params["height"] // 2, self.maze_params["width"] // 2
         self.maze[center_x, center_y] = 2  # Mark as start
+        self.start_pos = (center_x, center_y)
+        self.goal_pos = None
 
-        # Find a valid exit position on the border (not corners & inside the grid)
-        possible_exits = []
-
-        # Check top and bottom row (excluding corners)
-        for col in range(1, self.maze_params["width"] - 1):
-            if self.maze[1, col] == 0:  # Ensure exit is inside, not on the boundary
-                possible_exits.append((1, col))
-            if self.maze[self.maze_params["height"] - 2, col] == 0:
-                possible_exits.append((self.maze_params["height"] - 2, col))
-
-        # Check left and right columns (excluding corners)
-        for row in range(1, self.maze_params["height"] - 1):
-            if self.maze[row, 1] == 0:  # Ensure exit is inside, not on the boundary
-                possible_exits.append((row, 1))
-            if self.maze[row, self.maze_params["width"] - 2] == 0:
-                possible_exits.append((row, self.maze_params["width"] - 2))
+        # Count open neighbours of every cell at once (padding keeps edges in bounds)
+        height, width = self.maze.shape
+        open_cells = np.pad(self.maze == 0, 1)
+        open_paths = (open_cells[:-2, 1:-1].astype(int) + open_cells[2:, 1:-1] +
+                      open_cells[1:-1, :-2] + open_cells[1:-1, 2:])
 
-        # Ensure the exit has at least 2 open paths
-        valid_exits = []
-        for ex, ey in possible_exits:
-            open_paths = 0
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:  # Check 4 directions
-                nx, ny = ex + dx, ey + dy
-                if 0 <= nx < self.maze_params["height"] and 0 <= ny < self.maze_params["width"]:
-                    if self.maze[nx, ny] == 0:
-                        open_paths += 1
+        # Candidate exits just inside the border (not corners & inside the grid):
+        # top/bottom row pairs per column, then left/right column pairs per row
+        cols = np.arange(1, width - 1)
+        rows = np.arange(1, height - 1)
+        exit_rows = np.concatenate([
+            np.column_stack([np.full_like(cols, 1), np.full_like(cols, height - 2)]).ravel(),
+            np.column_stack([rows, rows]).ravel()
+        ])
+        exit_cols = np.concatenate([
+            np.column_stack([cols, cols]).ravel(),
+            np.column_stack([np.full_like(rows, 1), np.full_like(rows, width - 2)]).ravel()
+        ])
 
-            if open_paths >= 2:
-                valid_exits.append((ex, ey))
+        # Ensure the exit is open and has at least 2 open paths
+        valid = (self.maze[exit_rows, exit_cols] == 0) & (open_paths[exit_rows, exit_cols] >= 2)
+        valid_exits = list(zip(exit_rows[valid].tolist(), exit_cols[valid].tolist()))
 
         # If valid exits exist, randomly choose one
         if valid_exits:
             exit_x, exit_y = random.choice(valid_exits)
             self.maze[exit_x, exit_y] = 3  # Mark as exit
+            self.goal_pos = (exit_x, exit_y)
 
         return self.maze, maze_gen
 
@@ -21,6 +21,19 @@ MAX_STEPS = 20000  # Max steps before regenerating level
 if not os.path.exists(SAVE_FOLDER):
     os.makedirs(SAVE_FOLDER)
 
+# Saved Q-table filenames, scanned from SAVE_FOLDER once and kept current on save
+_saved_models = None
+
+def _saved_model_files():
+    """Return the set of saved Q-table filenames, listing SAVE_FOLDER on first use."""
+    global _saved_models
+    if _saved_models is None:
+        if os.path.exists(SAVE_FOLDER):
+            _saved_models = {f for f in os.listdir(SAVE_FOLDER) if f.endswith(".npy")}
+        else:
+            _saved_models = set()
+    return _saved_models
+
 class QLearningAgent:
     """AI decision-making agent that learns optimal paths through Q-learning."""
     
@@ -69,6 +82,7 @@ class QLearningAgent:
         """Save Q-table to disk."""
         filename = os.path.join(SAVE_FOLDER, f"bot_{self.maze_shape[0]}x{self.maze_shape[1]}_lvl_{level}.npy")
         np.save(filename, self.q_table)
+        _saved_model_files().add(os.path.basename(filename))
 
     def load_q_table(self, current_level, maze_shape):
         """Load Q-table from disk or create a new one if not found."""
@@ -77,14 +91,13 @@ class QLearningAgent:
             pattern = f"bot_{maze_shape[0]}x{maze_shape[1]}_lvl_"
             available_models = []
             
-            if os.path.exists(SAVE_FOLDER):
-                for f in os.listdir(SAVE_FOLDER):
-                    if f.startswith(pattern) and f.endswith(".npy"):
-                        try:
-                            level = int(f.split("_lvl_")[1].split(".")[0])
-                            available_models.append(level)
-                        except:
-                            continue
+            for f in _saved_model_files():
+                if f.startswith(pattern):
+                    try:
+                        level = int(f.split("_lvl_")[1].split(".")[0])
+                        available_models.append(level)
+                    except:
+                        continue
             
             available_models.sort(reverse=True)
             
@@ -100,6 +113,14 @@ class QLearningAgent:
         # If we got here, either no model was found or there was an error
         self.q_table = np.zeros((*maze_shape, len(ACTIONS)))
 
+def _locate_start_goal(game):
+    """Return the start and goal cells, using the ones recorded at generation when available."""
+    start, goal = game.start_pos, game.goal_pos
+    if start is None or goal is None:
+        start = tuple(np.argwhere(game.maze == 2)[0])
+        goal = tuple(np.argwhere(game.maze == 3)[0])
+    return start, goal
+
 class AStarMazeSolver:
     """Maze solver using A* pathfinding algorithm."""
     
@@ -111,8 +132,7 @@ class AStarMazeSolver:
     
     def _validate_start_goal_positions(self):
         """Ensure start/goal positions are within maze bounds."""
-        self.start = tuple(np.argwhere(self.game.maze == 2)[0])
-        self.goal = tuple(np.argwhere(self.game.maze == 3)[0])
+        self.start, self.goal = _locate_start_goal(self.game)
         
         # Clip positions to maze dimensions
         max_y, max_x = self.game.maze.shape
@@ -142,11 +162,12 @@ class AStarMazeSolver:
         counter = 0  # For tie-breaking
         came_from = {}  # Path tracking
         g_score = {self.start: 0}  # Cost from start to current
-        f_score = {self.start: self.heuristic(self.start, self.goal)}  # Estimated total cost
+        open_members = {self.start}  # Positions currently queued
         closed_set = set()  # Visited nodes
         
         while open_set:
             _, _, current = heapq.heappop(open_set)
+            open_members.discard(current)
             
             # Goal reached
             if current == self.goal:
@@ -176,12 +197,13 @@ class AStarMazeSolver:
                     # This path is better, record it
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g
-                    f_score[neighbor] = tentative_g + self.heuristic(neighbor, self.goal)
                     
                     # Add to open set if not already there
-                    if neighbor not in [item[2] for item in open_set]:
+                    if neighbor not in open_members:
                         counter += 1
-                        heapq.heappush(open_set, (f_score[neighbor], counter, neighbor))
+                        f_score = tentative_g + self.heuristic(neighbor, self.goal)  # Estimated total cost
+                        heapq.heappush(open_set, (f_score, counter, neighbor))
+                        open_members.add(neighbor)
         
         # No path found
         return []
@@ -305,8 +327,7 @@ class MazeBot:
     
     def _validate_start_goal_positions(self):
         """Set start and goal positions based on maze data."""
-        self.start = tuple(np.argwhere(self.game.maze == 2)[0])
-        self.goal = tuple(np.argwhere(self.game.maze == 3)[0])
+        self.start, self.goal = _locate_start_goal(self.game)
         
         # Make sure positions are within valid range
         max_y, max_x = self.game.maze.shape
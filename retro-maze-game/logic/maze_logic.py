@@ -10,6 +10,9 @@ class MazeGenerator:
         self.algorithm = algorithm
         self.maze = np.ones((self.height, self.width), dtype=int)
         self.directions = [(0, -1), (1, 0), (0, 1), (-1, 0)]  # Left, Down, Right, Up
+        self.entry_point = None
+        self.exit_point = None
+        self.player_position = None
     
     def generate_maze(self):
         """Generate a fully connected and playable maze"""
@@ -208,10 +211,9 @@ class MazeGenerator:
         """Create entry and exit points with guaranteed connectivity"""
         # First ensure we have a fully connected maze
         # Find all path cells (value 0)
-        path_cells = [(y, x) for y in range(1, self.height-1) 
-                    for x in range(1, self.width-1) if self.maze[y, x] == 0]
+        path_cells = self._interior_path_cells()
         
-        if not path_cells:
+        if len(path_cells) == 0:
             # If no path cells, create a simple path from top-left to bottom-right
             for y in range(1, self.height-1, 2):
                 for x in range(1, self.width-1):
@@ -219,19 +221,18 @@ class MazeGenerator:
             for x in range(1, self.width-1, 2):
                 for y in range(1, self.height-1):
                     self.maze[y, x] = 0
-            path_cells = [(y, x) for y in range(1, self.height-1) 
-                        for x in range(1, self.width-1) if self.maze[y, x] == 0]
+            path_cells = self._interior_path_cells()
         
         # Avoid central area to prevent the problematic pattern
-        center_y, center_x = self.height // 2, self.width // 2
+        center = np.array([self.height // 2, self.width // 2])
         buffer = max(2, min(self.height, self.width) // 10)  # Scale buffer with maze size
         
-        # Filter out cells too close to center
-        valid_cells = [(y, x) for y, x in path_cells if 
-                    abs(y - center_y) > buffer or abs(x - center_x) > buffer]
+        # Filter out cells too close to center (Chebyshev distance from it)
+        far_from_center = (np.abs(path_cells - center) > buffer).any(axis=1)
+        valid_cells = [tuple(cell) for cell in path_cells[far_from_center].tolist()]
         
         if not valid_cells:
-            valid_cells = path_cells  # Fallback if all cells are near center
+            valid_cells = [tuple(cell) for cell in path_cells.tolist()]  # Fallback if all cells are near center
         
         # Find paths to edges
         edge_paths = []
@@ -316,11 +317,15 @@ class MazeGenerator:
 
         # === ADD THIS BLOCK HERE ===
         # Create outer border walls
-        for y in range(self.height):
-            for x in range(self.width):
-                if y == 0 or y == self.height-1 or x == 0 or x == self.width-1:
-                    if (y, x) not in [self.entry_point, self.exit_point]:
-                        self.maze[y, x] = 1
+        border = np.ones(self.maze.shape, dtype=bool)
+        border[1:-1, 1:-1] = False
+        border[self.entry_point] = False
+        border[self.exit_point] = False
+        self.maze[border] = 1
+    
+    def _interior_path_cells(self):
+        """Return the (y, x) positions of all open cells inside the border, in row order."""
+        return np.argwhere(self.maze[1:-1, 1:-1] == 0) + 1
 
     def _find_nearest_path(self, y, x):
         """Find the nearest path cell from given coordinates"""
@@ -347,7 +352,7 @@ class MazeGenerator:
     
     def _validate_maze(self):
         """Check if the maze is fully connected and playable"""
-        if not hasattr(self, 'entry_point') or not hasattr(self, 'exit_point'):
+        if self.entry_point is None or self.exit_point is None:
             return False
         
         # Check if entry and exit are accessible
@@ -433,9 +438,9 @@ class MazeGenerator:
             "width": self.width,
             "height": self.height,
             "maze": self.maze.tolist(),
-            "entry": list(self.entry_point) if hasattr(self, 'entry_point') else None,
-            "exit": list(self.exit_point) if hasattr(self, 'exit_point') else None,
-            "player": list(self.player_position) if hasattr(self, 'player_position') else None
+            "entry": list(self.entry_point) if self.entry_point is not None else None,
+            "exit": list(self.exit_point) if self.exit_point is not None else None,
+            "player": list(self.player_position) if self.player_position is not None else None
         }
         with open(filename, 'w') as f:
             json.dump(maze_dict, f, indent=2)
@@ -445,7 +450,7 @@ class MazeGenerator:
         for y in range(self.height):
             line = ""
             for x in range(self.width):
-                if show_player and hasattr(self, 'player_position') and (y, x) == self.player_position:
+                if show_player and (y, x) == self.player_position:
                     line += "P "  # Player
                 elif (y, x) == self.entry_point:
                     line += "S "  # Start
@@ -1,13 +1,23 @@
 import pygame
 import time
-import random
+import logging
 import numpy as np
-import os
+from concurrent.futures import ThreadPoolExecutor
 from utils.config import *
 from gui.retro_theme import RetroTheme
 from gui.pause_menu import PauseMenu
 from logic.adaptive_logic import AdaptiveMazeGame
 from logic.ai_bot_logic import EnhancedMazeBot
+from utils.helpers import render_text
+from utils.maze_tiles import visible_tiles
+
+logger = logging.getLogger(__name__)
+
+# Labels of the race stats column, top to bottom
+_STATS_SCHEMA = (
+    "Level: ", "Time: ", "Player Moves: ", "AI Moves: ",
+    "Player Backtracks: ", "AI Backtracks: ", "Score: "
+)
 
 class PlayerVsBotGame:
     """Player vs Bot racing game mode."""
@@ -26,6 +36,47 @@ class PlayerVsBotGame:
         # Load theme
         self.theme = RetroTheme()
         
+        # Resolve maze tile surfaces once for the render loop, keyed by cell value
+        self.maze_tiles = {
+            1: self.theme.wall_tile,   # Wall
+            0: self.theme.path_tile,   # Path
+            2: self.theme.start_tile,  # Start
+            3: self.theme.goal_tile    # Goal
+        }
+        
+        # Panel labels never change, so render their glow once
+        self.player_label = self.theme.get_glowing_text("PLAYER", 24, NEON_BLUE)
+        self.ai_label = self.theme.get_glowing_text("AI", 24, NEON_PURPLE)
+        
+        # Status prompts shown beside the stats
+        self.start_prompt = self.theme.get_glowing_text("Move to start the race!", 24, NEON_YELLOW)
+        self.reset_prompt = self.theme.get_glowing_text("AI is resetting...", 24, NEON_PINK)
+        
+        # Semi-transparent overlay dimming the race behind announcements
+        self.overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 200))
+        self.overlay = self.overlay.convert_alpha()
+        
+        # Winner announcement; the winner text is rendered when a race ends
+        self.continue_text = self.theme.get_glowing_text("Press SPACE to continue", 28, NEON_CYAN)
+        self.continue_pos = ((self.width - self.continue_text.get_width()) // 2, self.height // 2 + 20)
+        self.winner_text = None
+        self.winner_pos = None
+        
+        # Pre-render static stat labels; values are rendered on demand
+        self.stat_labels = [
+            self.theme.medium_font.render(label, True, NEON_GREEN)
+            for label in _STATS_SCHEMA
+        ]
+        
+        # Stats layout inside the stats panel: (label, label position, value position)
+        self.stats_layout = [
+            (label, (0, i * 30), (label.get_width(), i * 30))
+            for i, label in enumerate(self.stat_labels)
+        ]
+        self.start_prompt_pos = (0, (len(self.stat_labels) + 1) * 30)
+        self.reset_prompt_pos = (0, (len(self.stat_labels) + 2) * 30)
+        
         # Initialize games for player and AI
         self.player_game = AdaptiveMazeGame(player_id)
         self.ai_game = AdaptiveMazeGame(player_id + "_AI")
@@ -33,6 +84,8 @@ class PlayerVsBotGame:
         # Initialize variables
         self.player_path = []
         self.ai_path = []
+        self.player_path_set = set()
+        self.ai_path_set = set()
         self.player_wins = 0
         self.ai_wins = 0
         self.races = 0
@@ -41,8 +94,12 @@ class PlayerVsBotGame:
         self.player_made_first_move = False
         self.ai_resetting = False
         
+        # Worker that plans the bot's opening route off the render loop
+        self.ai_planner = ThreadPoolExecutor(max_workers=1)
+        self.ai_plan = None
+        
         # Create pause menu
-        self.pause_menu = PauseMenu(self.screen, self.resume_game, self.return_to_main_menu)
+        self.pause_menu = PauseMenu.get(self.screen, self.resume_game, self.return_to_main_menu, self.theme)
         
         # Load level and start AI timer
         self.load_new_level()
@@ -50,28 +107,24 @@ class PlayerVsBotGame:
     
     def init_ai_solver(self):
         """Initialize AI bot for the AI's maze"""
-        current_size = self.ai_game.maze.shape
-        bot_filename = f"bot_{current_size[0]}x{current_size[1]}_lvl_1.npy"
-        
-        # Look for the AI model in assets/bots folder
-        bot_dir = os.path.join(ASSET_DIR, "bots")
-        if not os.path.exists(bot_dir):
-            os.makedirs(bot_dir)
-        
-        # Initialize EnhancedMazeBot with appropriate difficulty level
+        # Initialize EnhancedMazeBot with appropriate difficulty level; saved
+        # models are found through the bot module's cached index
         self.ai_bot = EnhancedMazeBot(self.ai_game, level=self.player_game.current_level)
         
         # Initialize AI state and goal
-        start_pos = np.argwhere(self.ai_maze == 2)[0]
-        goal_pos = np.argwhere(self.ai_maze == 3)[0]
+        start_pos = self.start_pos
         
-        self.ai_bot.state = tuple(start_pos)
-        self.ai_bot.goal = tuple(goal_pos)
+        self.ai_bot.state = start_pos
+        self.ai_bot.goal = self.goal_pos
         self.ai_position = np.array([start_pos[0], start_pos[1]], dtype=float)
-        self.ai_path = [tuple(start_pos)]
+        self.ai_path = [start_pos]
+        self.ai_path_set = {start_pos}
         self.ai_reached_goal = False
         self.ai_backtracks = 0
         self.ai_moves = 0
+        
+        # Warm the bot's A* cache in the background so the level appears at once
+        self.ai_plan = self.ai_planner.submit(self.ai_bot.get_optimal_path, start_pos)
     
     def load_new_level(self):
         """Generate new level and initialize both player and AI with identical mazes"""
@@ -88,8 +141,14 @@ class PlayerVsBotGame:
         self.ai_game.maze = self.player_maze.copy()
         self.ai_maze = self.ai_game.maze
         
-        # Player starts at entry point (value 2 in maze)
-        self.player_pos = np.argwhere(self.player_maze == 2)[0].astype(float)
+        # Entry (value 2) and goal (value 3) were recorded when the maze was generated
+        self.start_pos = self.player_game.start_pos
+        self.goal_pos = self.player_game.goal_pos
+        self.ai_game.start_pos = self.start_pos
+        self.ai_game.goal_pos = self.goal_pos
+        
+        # Player starts at entry point
+        self.player_pos = (int(self.start_pos[0]), int(self.start_pos[1]))
         
         # Calculate pixel dimensions
         self.maze_pixel_width = self.maze_width * TILE_SIZE
@@ -100,14 +159,54 @@ class PlayerVsBotGame:
         self.panel_width = max_panel_width
         self.panel_height = min(800, self.maze_pixel_height)
         
+        # Persistent panels, redrawn in place every frame
+        self.player_panel = pygame.Surface((self.panel_width, self.panel_height)).convert()
+        self.ai_panel = pygame.Surface((self.panel_width, self.panel_height)).convert()
+        
+        # Panel labels are centered along the top of their panel
+        self.player_label_pos = ((self.panel_width - self.player_label.get_width()) // 2, 10)
+        self.ai_label_pos = ((self.panel_width - self.ai_label.get_width()) // 2, 10)
+        
+        # Panel positions (center horizontally with spacing between) and their
+        # borders only change with the panel size
+        panel_spacing = 20
+        total_width = (self.panel_width * 2) + panel_spacing
+        self.panel_y = (self.height - self.panel_height) // 2
+        self.player_panel_x = (self.width - total_width) // 2
+        self.ai_panel_x = self.player_panel_x + self.panel_width + panel_spacing
+        self.panel_borders = (
+            (NEON_BLUE, pygame.Rect(self.player_panel_x - 2, self.panel_y - 2,
+                                    self.panel_width + 4, self.panel_height + 4)),
+            (NEON_PURPLE, pygame.Rect(self.ai_panel_x - 2, self.panel_y - 2,
+                                      self.panel_width + 4, self.panel_height + 4))
+        )
+        
+        # Stats column right of the AI panel, composed on a persistent surface
+        self.stats_x = self.ai_panel_x + self.panel_width + 20
+        self.stats_y = self.panel_y
+        self.stats_panel = pygame.Surface((max(1, self.width - self.stats_x),
+                                           max(1, self.height - self.stats_y))).convert()
+        self.stats_key = None
+        
+        # Screen regions redrawn during a race: both bordered panels and the stats
+        self.dirty_regions = [
+            self.panel_borders[0][1].union(self.panel_borders[1][1]),
+            pygame.Rect((self.stats_x, self.stats_y), self.stats_panel.get_size())
+        ]
+        
+        # Push the whole screen to the display on the next frame
+        self.full_update = True
+        
         # Initialize AI
         self.init_ai_solver()
         
         # Reset race status
         self.current_winner = None
         self.game_over = False
-        self.player_path = [tuple(self.player_pos.astype(int))]
+        self.player_path = [self.player_pos]
         self.ai_path = [self.ai_bot.state]
+        self.player_path_set = set(self.player_path)
+        self.ai_path_set = set(self.ai_path)
         self.player_made_first_move = False
         self.ai_resetting = False
         
@@ -144,10 +243,11 @@ class PlayerVsBotGame:
     
     def reset_ai_path(self):
         """Reset AI to starting position when it gets stuck"""
-        start_pos = np.argwhere(self.ai_maze == 2)[0]
-        self.ai_bot.state = tuple(start_pos)
+        start_pos = self.start_pos
+        self.ai_bot.state = start_pos
         self.ai_position = np.array([start_pos[0], start_pos[1]], dtype=float)
-        self.ai_path = [tuple(start_pos)]
+        self.ai_path = [start_pos]
+        self.ai_path_set = {start_pos}
         self.ai_backtracks = 0
         self.ai_resetting = False
     
@@ -171,8 +271,7 @@ class PlayerVsBotGame:
             ai_pos_col, ai_pos_row = self.ai_bot.state[1], self.ai_bot.state[0]
         else:
             # Fallback to start position
-            ai_pos = np.argwhere(self.ai_maze == 2)[0]
-            ai_pos_row, ai_pos_col = ai_pos[0], ai_pos[1]
+            ai_pos_row, ai_pos_col = self.start_pos
         
         # Center camera on AI
         cam_x = ai_pos_col * TILE_SIZE - self.panel_width // 2
@@ -185,8 +284,39 @@ class PlayerVsBotGame:
         return (max(0, min(cam_x, max_cam_x)), 
                 max(0, min(cam_y, max_cam_y)))
     
+    def _draw_maze_tiles(self, panel, maze, cam_x, cam_y):
+        """Draw the maze tiles visible through the camera onto a panel."""
+        # Visible tile range follows directly from the camera position
+        col_start = max(0, int(cam_x) // TILE_SIZE)
+        col_end = min(self.maze_width, (int(cam_x) + self.panel_width) // TILE_SIZE + 1)
+        row_start = max(0, int(cam_y) // TILE_SIZE)
+        row_end = min(self.maze_height, (int(cam_y) + self.panel_height) // TILE_SIZE + 1)
+        
+        # Classify the visible window, then collect every tile blit and
+        # hand them to pygame in one batch
+        positions = visible_tiles(maze, row_start, row_end, col_start, col_end, self.maze_tiles)
+        blit_sequence = []
+        for value, tile in self.maze_tiles.items():
+            for row, col in positions[value].tolist():
+                x = col * TILE_SIZE - cam_x
+                y = row * TILE_SIZE - cam_y
+                blit_sequence.append((tile, (x, y)))
+        
+        panel.blits(blit_sequence, doreturn=False)
+    
+    def _draw_path_trail(self, panel, path, cam_x, cam_y, color):
+        """Draw a path through the centers of its tiles as one polyline."""
+        if len(path) > 1:
+            offset_x = TILE_SIZE // 2 - cam_x
+            offset_y = TILE_SIZE // 2 - cam_y
+            points = [(col * TILE_SIZE + offset_x, row * TILE_SIZE + offset_y) for row, col in path]
+            pygame.draw.lines(panel, color, False, points, 3)
+    
     def draw_game(self):
-        """Draw the game screen with both mazes side by side."""
+        """Draw the game screen with both mazes side by side.
+        
+        Returns the list of screen rects to push to the display.
+        """
         # Fill background
         self.screen.fill(BLACK)
         
@@ -194,51 +324,22 @@ class PlayerVsBotGame:
         player_cam_x, player_cam_y = self.calculate_player_camera()
         ai_cam_x, ai_cam_y = self.calculate_ai_camera()
         
-        # Calculate panel positions (center horizontally with spacing between)
-        panel_spacing = 20
-        total_width = (self.panel_width * 2) + panel_spacing
-        start_x = (self.width - total_width) // 2
-        panel_y = (self.height - self.panel_height) // 2
-        
-        player_panel_x = start_x
-        ai_panel_x = start_x + self.panel_width + panel_spacing
+        # Panel positions are laid out once per level
+        panel_y = self.panel_y
+        player_panel_x = self.player_panel_x
+        ai_panel_x = self.ai_panel_x
         
-        # Create game panels
-        player_panel = pygame.Surface((self.panel_width, self.panel_height))
-        ai_panel = pygame.Surface((self.panel_width, self.panel_height))
+        # Clear game panels
+        player_panel = self.player_panel
+        ai_panel = self.ai_panel
         player_panel.fill(BLACK)
         ai_panel.fill(BLACK)
         
         # Draw player maze
-        for row in range(self.maze_height):
-            for col in range(self.maze_width):
-                # Calculate tile position within panel
-                x = col * TILE_SIZE - player_cam_x
-                y = row * TILE_SIZE - player_cam_y
-                
-                # Skip tiles outside the panel
-                if (x + TILE_SIZE <= 0 or x >= self.panel_width or
-                    y + TILE_SIZE <= 0 or y >= self.panel_height):
-                    continue
-                
-                # Draw appropriate tile
-                if self.player_maze[row, col] == 1:  # Wall
-                    player_panel.blit(self.theme.wall_tile, (x, y))
-                elif self.player_maze[row, col] == 0:  # Path
-                    player_panel.blit(self.theme.path_tile, (x, y))
-                elif self.player_maze[row, col] == 2:  # Start
-                    player_panel.blit(self.theme.start_tile, (x, y))
-                elif self.player_maze[row, col] == 3:  # Goal
-                    player_panel.blit(self.theme.goal_tile, (x, y))
+        self._draw_maze_tiles(player_panel, self.player_maze, player_cam_x, player_cam_y)
         
         # Draw player path
-        if len(self.player_path) > 1:
-            for i in range(1, len(self.player_path)):
-                prev = (self.player_path[i-1][1]*TILE_SIZE - player_cam_x + TILE_SIZE//2, 
-                       self.player_path[i-1][0]*TILE_SIZE - player_cam_y + TILE_SIZE//2)
-                curr = (self.player_path[i][1]*TILE_SIZE - player_cam_x + TILE_SIZE//2, 
-                       self.player_path[i][0]*TILE_SIZE - player_cam_y + TILE_SIZE//2)
-                pygame.draw.line(player_panel, NEON_BLUE, prev, curr, 3)
+        self._draw_path_trail(player_panel, self.player_path, player_cam_x, player_cam_y, NEON_BLUE)
         
         # Draw player sprite
         player_x = self.player_pos[1] * TILE_SIZE - player_cam_x
@@ -246,39 +347,13 @@ class PlayerVsBotGame:
         player_panel.blit(self.theme.player_sprite, (player_x, player_y))
         
         # Draw player label
-        player_label = self.theme.get_glowing_text("PLAYER", 24, NEON_BLUE)
-        player_panel.blit(player_label, ((self.panel_width - player_label.get_width()) // 2, 10))
+        player_panel.blit(self.player_label, self.player_label_pos)
         
         # Draw AI maze
-        for row in range(self.maze_height):
-            for col in range(self.maze_width):
-                # Calculate tile position within panel
-                x = col * TILE_SIZE - ai_cam_x
-                y = row * TILE_SIZE - ai_cam_y
-                
-                # Skip tiles outside the panel
-                if (x + TILE_SIZE <= 0 or x >= self.panel_width or
-                    y + TILE_SIZE <= 0 or y >= self.panel_height):
-                    continue
-                
-                # Draw appropriate tile
-                if self.ai_maze[row, col] == 1:  # Wall
-                    ai_panel.blit(self.theme.wall_tile, (x, y))
-                elif self.ai_maze[row, col] == 0:  # Path
-                    ai_panel.blit(self.theme.path_tile, (x, y))
-                elif self.ai_maze[row, col] == 2:  # Start
-                    ai_panel.blit(self.theme.start_tile, (x, y))
-                elif self.ai_maze[row, col] == 3:  # Goal
-                    ai_panel.blit(self.theme.goal_tile, (x, y))
+        self._draw_maze_tiles(ai_panel, self.ai_maze, ai_cam_x, ai_cam_y)
         
         # Draw AI path
-        if len(self.ai_path) > 1:
-            for i in range(1, len(self.ai_path)):
-                prev = (self.ai_path[i-1][1]*TILE_SIZE - ai_cam_x + TILE_SIZE//2, 
-                       self.ai_path[i-1][0]*TILE_SIZE - ai_cam_y + TILE_SIZE//2)
-                curr = (self.ai_path[i][1]*TILE_SIZE - ai_cam_x + TILE_SIZE//2, 
-                       self.ai_path[i][0]*TILE_SIZE - ai_cam_y + TILE_SIZE//2)
-                pygame.draw.line(ai_panel, NEON_PURPLE, prev, curr, 3)
+        self._draw_path_trail(ai_panel, self.ai_path, ai_cam_x, ai_cam_y, NEON_PURPLE)
         
         # Draw AI sprite (with modified color)
         if self.ai_bot and not self.ai_reached_goal:
@@ -290,74 +365,88 @@ class PlayerVsBotGame:
             ai_panel.blit(bot_sprite, (ai_x, ai_y))
         
         # Draw AI label
-        ai_label = self.theme.get_glowing_text("AI", 24, NEON_PURPLE)
-        ai_panel.blit(ai_label, ((self.panel_width - ai_label.get_width()) // 2, 10))
+        ai_panel.blit(self.ai_label, self.ai_label_pos)
         
         # Blit panels to screen
         self.screen.blit(player_panel, (player_panel_x, panel_y))
         self.screen.blit(ai_panel, (ai_panel_x, panel_y))
         
         # Draw panel borders
-        pygame.draw.rect(self.screen, NEON_BLUE, 
-                        (player_panel_x-2, panel_y-2, self.panel_width+4, self.panel_height+4), 2)
-        pygame.draw.rect(self.screen, NEON_PURPLE, 
-                        (ai_panel_x-2, panel_y-2, self.panel_width+4, self.panel_height+4), 2)
+        for color, border in self.panel_borders:
+            pygame.draw.rect(self.screen, color, border, 2)
         
         # Draw stats
-        stats_x = ai_panel_x + self.panel_width + 20
-        stats_y = panel_y
-        self.draw_stats(stats_x, stats_y)
+        self.draw_stats(self.stats_x, self.stats_y)
         
-        # Draw winner announcement if game is over
+        # Draw winner announcement if game is over; its overlay covers the screen
         if self.game_over and self.current_winner:
             self.draw_winner_announcement()
+            self.full_update = True
+            return [self.screen.get_rect()]
+        
+        if self.full_update:
+            self.full_update = False
+            return [self.screen.get_rect()]
+        return self.dirty_regions
     
     def draw_stats(self, x, y):
         """Draw game statistics."""
-        stats = [
-            f"Level: {self.player_game.current_level}",
-            f"Time: {time.time() - self.start_time:.1f}s",
-            f"Player Moves: {self.player_tracker.total_moves}",
-            f"AI Moves: {self.ai_moves}",
-            f"Player Backtracks: {self.player_tracker.backtracks}",
-            f"AI Backtracks: {self.ai_backtracks}/{10}",
-            f"Score: {self.player_wins} - {self.ai_wins}"
-        ]
+        # Values in _STATS_SCHEMA order
+        values = (
+            f"{self.player_game.current_level}",
+            f"{time.time() - self.start_time:.1f}s",
+            f"{self.player_tracker.total_moves}",
+            f"{self.ai_moves}",
+            f"{self.player_tracker.backtracks}",
+            f"{self.ai_backtracks}/{10}",
+            f"{self.player_wins} - {self.ai_wins}"
+        )
+        
+        # Everything shown on the panel: the values plus the prompt flags
+        stats_key = (values, self.player_made_first_move, self.ai_resetting)
+        
+        # Recompose the stats panel only when something shown on it changed
+        if stats_key == self.stats_key:
+            self.screen.blit(self.stats_panel, (x, y))
+            return
+        self.stats_key = stats_key
         
-        for i, stat in enumerate(stats):
-            text = self.theme.medium_font.render(stat, True, NEON_GREEN)
-            self.screen.blit(text, (x, y + i * 30))
+        # Collect the stat labels, values and prompts and blit them in one batch
+        blit_sequence = []
+        for (label, label_pos, value_pos), value in zip(self.stats_layout, values):
+            blit_sequence.append((label, label_pos))
+            blit_sequence.append((render_text(value, self.theme.medium_font, NEON_GREEN), value_pos))
         
         # Show a prompt for the player to move first if they haven't yet
         if not self.player_made_first_move:
-            prompt_y = y + (len(stats) + 1) * 30
-            waiting_text = self.theme.get_glowing_text("Move to start the race!", 24, NEON_YELLOW)
-            self.screen.blit(waiting_text, (x, prompt_y))
+            blit_sequence.append((self.start_prompt, self.start_prompt_pos))
         
         # Show AI reset warning if applicable
         if self.ai_resetting:
-            reset_y = y + (len(stats) + 2) * 30
-            reset_text = self.theme.get_glowing_text("AI is resetting...", 24, NEON_PINK)
-            self.screen.blit(reset_text, (x, reset_y))
+            blit_sequence.append((self.reset_prompt, self.reset_prompt_pos))
+        
+        # Compose on the stats panel, then place it on screen
+        self.stats_panel.fill(BLACK)
+        self.stats_panel.blits(blit_sequence, doreturn=False)
+        self.screen.blit(self.stats_panel, (x, y))
+    
+    def _set_winner(self, winner):
+        """End the race and render the announcement for its winner."""
+        self.current_winner = winner
+        self.game_over = True
+        
+        winner_color = NEON_GREEN if winner == "PLAYER" else NEON_PURPLE
+        self.winner_text = self.theme.get_glowing_text(f"{winner} WINS!", 48, winner_color)
+        self.winner_pos = ((self.width - self.winner_text.get_width()) // 2, self.height // 2 - 50)
     
     def draw_winner_announcement(self):
         """Draw winner announcement overlay."""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
-        
-        # Create winner text
-        winner_color = NEON_GREEN if self.current_winner == "PLAYER" else NEON_PURPLE
-        winner_text = self.theme.get_glowing_text(f"{self.current_winner} WINS!", 48, winner_color)
-        continue_text = self.theme.get_glowing_text("Press SPACE to continue", 28, NEON_CYAN)
-        
-        # Center and draw texts
-        winner_x = (self.width - winner_text.get_width()) // 2
-        continue_x = (self.width - continue_text.get_width()) // 2
+        # Dim the race behind the announcement
+        self.screen.blit(self.overlay, (0, 0))
         
-        self.screen.blit(winner_text, (winner_x, self.height // 2 - 50))
-        self.screen.blit(continue_text, (continue_x, self.height // 2 + 20))
+        # Draw the texts rendered when the race ended
+        self.screen.blit(self.winner_text, self.winner_pos)
+        self.screen.blit(self.continue_text, self.continue_pos)
     
     def move_player(self, dx, dy):
         """Move player with collision detection."""
@@ -365,8 +454,8 @@ class PlayerVsBotGame:
         if self.game_over or self.paused:
             return
         
-        new_pos = self.player_pos + [dy, dx]
-        new_row, new_col = new_pos.astype(int)
+        new_row = self.player_pos[0] + dy
+        new_col = self.player_pos[1] + dx
         
         # Check if move is valid (within bounds and not a wall)
         if (0 <= new_row < self.maze_height and 
@@ -381,20 +470,20 @@ class PlayerVsBotGame:
             
             # Check for backtracking
             current = (new_row, new_col)
-            if current in self.player_path[:-1]:
+            if current in self.player_path_set:
                 self.player_tracker.backtracks += 1
             
             # Update position
-            self.player_pos = new_pos
+            self.player_pos = current
             self.player_path.append(current)
+            self.player_path_set.add(current)
             self.player_tracker.total_moves += 1
             
             # Check if reached goal
             if self.player_maze[new_row, new_col] == 3:
                 if not self.ai_reached_goal:
                     # Player won!
-                    self.current_winner = "PLAYER"
-                    self.game_over = True
+                    self._set_winner("PLAYER")
                     self.player_wins += 1
                     self.races += 1
                 self.player_tracker.complete_maze()
@@ -409,6 +498,12 @@ class PlayerVsBotGame:
         if self.game_over or self.ai_reached_goal or not self.ai_bot:
             return
         
+        # Wait for the opening route before the bot starts moving
+        if self.ai_plan is not None:
+            if not self.ai_plan.done():
+                return
+            self._finish_ai_plan()
+        
         # Check if AI needs to reset due to excessive backtracks
         if self.ai_backtracks > AI_BACKTRACK_LIMIT:
             self.ai_resetting = True
@@ -430,24 +525,31 @@ class PlayerVsBotGame:
                 self.ai_moves += 1
                 
                 # Detect backtracks
-                if tuple(new_state) in [tuple(pos) for pos in self.ai_path[:-1]]:
+                if new_state in self.ai_path_set:
                     self.ai_backtracks += 1
+                self.ai_path_set.add(new_state)
                 
                 # Check if AI reached goal
                 if new_state == self.ai_bot.goal:
                     self.ai_reached_goal = True
                     if self.current_winner is None:  # Only set winner if player hasn't won yet
-                        self.current_winner = "AI"
-                        self.game_over = True
+                        self._set_winner("AI")
                         self.ai_wins += 1
                         self.races += 1
     
+    def _finish_ai_plan(self):
+        """Collect the finished opening-route plan and surface any worker error."""
+        plan, self.ai_plan = self.ai_plan, None
+        try:
+            plan.result()
+        except Exception:
+            # The plan only warms the A* cache; the bot still routes itself step by step
+            logger.exception("AI opening route planning failed")
+    
     def show_game_completion(self):
         """Show game completion screen with final scores."""
-        # Create semi-transparent overlay
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        self.screen.blit(overlay, (0, 0))
+        # Dim the race behind the final scores
+        self.screen.blit(self.overlay, (0, 0))
         
         # Create completion texts
         completion_text = self.theme.get_glowing_text("GAME COMPLETED!", 48, NEON_YELLOW)
@@ -465,24 +567,24 @@ class PlayerVsBotGame:
         
         pygame.display.flip()
         
-        # Wait for player to press SPACE
+        # Wait for player to press SPACE, sleeping until the next event arrives
         waiting = True
         while waiting and self.running:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+            event = pygame.event.wait()
+            if event.type == pygame.QUIT:
+                self.running = False
+                waiting = False
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_SPACE:
+                    waiting = False
+                    # Reset game stats and load new level
+                    self.player_wins = 0
+                    self.ai_wins = 0
+                    self.races = 0
+                    self.load_new_level()
+                elif event.key == pygame.K_ESCAPE:
                     self.running = False
                     waiting = False
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_SPACE:
-                        waiting = False
-                        # Reset game stats and load new level
-                        self.player_wins = 0
-                        self.ai_wins = 0
-                        self.races = 0
-                        self.load_new_level()
-                    elif event.key == pygame.K_ESCAPE:
-                        self.running = False
-                        waiting = False
     
     def handle_events(self):
         """Process input events."""
@@ -514,10 +616,12 @@ class PlayerVsBotGame:
     def toggle_pause(self):
         """Toggle the pause state of the game."""
         self.paused = not self.paused
+        self.full_update = True
     
     def resume_game(self):
         """Resume the game from pause."""
         self.paused = False
+        self.full_update = True
     
     def return_to_main_menu(self):
         """Return to main menu."""
@@ -525,13 +629,18 @@ class PlayerVsBotGame:
     
     def run(self):
         """Main game loop."""
-        while self.running:
-            if self.paused:
-                self.pause_menu.draw()
-                self.pause_menu.handle_events()
-            else:
-                self.handle_events()
-                self.draw_game()
-            
-            pygame.display.flip()
-            self.clock.tick(FPS)
\ No newline at end of file
+        try:
+            while self.running:
+                if self.paused:
+                    dirty_rects = self.pause_menu.draw()
+                    self.pause_menu.handle_events()
+                else:
+                    self.handle_events()
+                    dirty_rects = self.draw_game()
+                
+                pygame.display.update(dirty_rects)
+                self.clock.tick(FPS)
+        finally:
+            # Also reached when quitting from the pause menu exits the process
+            self.ai_planner.shutdown(wait=False, cancel_futures=True)
+            self.pause_menu.release()
\ No newline at end of file
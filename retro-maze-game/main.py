@@ -7,6 +7,10 @@ def main():
     screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
     pygame.display.set_caption("Retro-Futuristic Maze Game")
     
+    # No screen handles motion events (hover reads the mouse position directly),
+    # so keep them out of the queue every event loop drains
+    pygame.event.set_blocked([pygame.MOUSEMOTION, pygame.JOYAXISMOTION])
+    
     # Load and run the main menu
     main_menu = MainMenu(screen)
     main_menu.run()
@@ -1,7 +1,13 @@
 import os
 import pygame
+from collections import OrderedDict
+from functools import lru_cache
 from utils.config import *
 
+# Recently rendered text surfaces, keyed by (text, font, color)
+_TEXT_CACHE = OrderedDict()
+_TEXT_CACHE_SIZE = 256
+
 def load_font(font_name, size):
     """Load a font, first trying the custom fonts, then falling back to system fonts."""
     # Try loading from assets/fonts
@@ -18,6 +24,32 @@ def load_font(font_name, size):
     except:
         return pygame.font.SysFont(None, size)  # Default system font
 
+def render_text(text, font, color):
+    """Render anti-aliased text, reusing the surface for recently drawn strings."""
+    key = (text, font, color)
+    surface = _TEXT_CACHE.get(key)
+    if surface is not None:
+        _TEXT_CACHE.move_to_end(key)
+        return surface
+    
+    surface = _to_display_format(font.render(text, True, color))
+    
+    # Changing values such as elapsed time keep adding strings, so evict the oldest
+    _TEXT_CACHE[key] = surface
+    if len(_TEXT_CACHE) > _TEXT_CACHE_SIZE:
+        _TEXT_CACHE.popitem(last=False)
+    return surface
+
+@lru_cache(maxsize=None)
+def _glow_offsets(glow_radius):
+    """Blit positions of the glow layers around the centered text."""
+    return tuple(
+        (dx + glow_radius, dy + glow_radius)
+        for dx in range(-glow_radius, glow_radius + 1)
+        for dy in range(-glow_radius, glow_radius + 1)
+        if dx or dy  # Skip the center (that's where the final text will go)
+    )
+
 def create_glowing_text(text, font, text_color, glow_color, glow_radius=2):
     """Create text with a neon glowing effect."""
     # Create the base text surface
@@ -29,28 +61,17 @@ def create_glowing_text(text, font, text_color, glow_color, glow_radius=2):
                                   text_surface.get_height() + padding), 
                                   pygame.SRCALPHA)
     
-    # Draw the text multiple times with slight offsets for the glow
-    for dx in range(-glow_radius, glow_radius + 1):
-        for dy in range(-glow_radius, glow_radius + 1):
-            # Skip the center (that's where the final text will go)
-            if dx == 0 and dy == 0:
-                continue
-                
-            # Calculate alpha based on distance from center
-            distance = (dx**2 + dy**2) ** 0.5
-            alpha = int(max(0, 255 * (1 - distance / glow_radius)))
-            
-            # Create a custom color with alpha
-            color_with_alpha = (*glow_color, alpha)
-            
-            # Create the glow layer and blit it
-            glow_layer = font.render(text, True, color_with_alpha)
-            glow_surface.blit(glow_layer, (dx + glow_radius, dy + glow_radius))
+    # Draw the text multiple times with slight offsets for the glow.
+    # font.render ignores the alpha of its color, so every layer is the same
+    # opaque glyph; render it once and blit it at each offset.
+    glow_layer = font.render(text, True, glow_color)
+    glow_surface.blits([(glow_layer, offset) for offset in _glow_offsets(glow_radius)],
+                       doreturn=False)
     
     # Add the original text on top
     glow_surface.blit(text_surface, (glow_radius, glow_radius))
     
-    return glow_surface
+    return _to_display_format(glow_surface)
 
 def create_neon_button(text, font, width, height, text_color, glow_color, bg_color=None):
     """Create a neon-styled button with glowing text."""
@@ -72,7 +93,13 @@ def create_neon_button(text, font, width, height, text_color, glow_color, bg_col
     text_y = (height - text_surf.get_height()) // 2
     button_surf.blit(text_surf, (text_x, text_y))
     
-    return button_surf
+    return _to_display_format(button_surf)
+
+def _to_display_format(surface):
+    """Convert a per-pixel alpha surface to the display format once a display exists."""
+    if pygame.display.get_surface() is not None:
+        return surface.convert_alpha()
+    return surface
 
 def center_rect(surface_width, surface_height, rect_width, rect_height):
     """Calculate the centered rectangle coordinates."""
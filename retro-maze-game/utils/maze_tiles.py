@@ -0,0 +1,16 @@
+import numpy as np
+
+
+def visible_tiles(maze, row_start, row_end, col_start, col_end, values):
+    """Return the (row, col) positions of each cell value in values inside
+    the maze window [row_start:row_end, col_start:col_end].
+    
+    The result maps every requested value to an int32 array of shape (N, 2)
+    in maze coordinates and row-major order.
+    """
+    visible = maze[row_start:row_end, col_start:col_end]
+    offset = np.array([row_start, col_start], dtype=np.int32)
+    return {
+        value: np.argwhere(visible == value).astype(np.int32) + offset
+        for value in values
+    }